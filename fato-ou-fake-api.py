@@ -1,13 +1,149 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import json
 from datetime import datetime
+from dateutil import parser as dtparser
 import os
+from xml.etree import ElementTree
 import feedparser
 import re
-from bs4 import BeautifulSoup
-import time
+from bs4 import BeautifulSoup, SoupStrainer
 import random
+import shelve
+import concurrent.futures
+import multiprocessing
+import threading
+import asyncio
+import aiohttp
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import orjson
+
+# Palavras-chave que indicam uma checagem Fato ou Fake no título
+_KEYWORDS_CHECAGEM = ('fato', 'fake', 'falso', 'verdade', 'é falso que', 'é verdade que', 'checamos')
+
+# Padrões comuns usados pelo G1 para indicar FAKE no título
+_PADROES_FAKE = (
+    'é fake',
+    'é falso', 
+    'não é verdade', 
+    'não é verdadeiro',
+    'falso que', 
+    'fake news',
+    'boato', 
+    'mentira', 
+    'enganoso', 
+    'não é real', 
+    'não aconteceu',
+    'não procede',
+    'não existe',
+    'não é fato'
+)
+
+# Padrões comuns usados pelo G1 para indicar FATO no título
+_PADROES_FATO = (
+    'é fato', 
+    'é verdade', 
+    'verdadeiro', 
+    'aconteceu', 
+    'é real',
+    'confirmado', 
+    'verificado', 
+    'comprovado',
+    'procede',
+    'é verdadeiro'
+)
+
+# Expressões pré-compiladas para identificar checagens pelo link e pelo título
+_LINK_CHECAGEM_RE = re.compile(r'fato-ou-fake', re.IGNORECASE)
+_CHECAGEM_RE = re.compile('|'.join(map(re.escape, _KEYWORDS_CHECAGEM)), re.IGNORECASE)
+
+# Expressões pré-compiladas, na ordem de prioridade da classificação
+_FAKE_RE = re.compile('|'.join(map(re.escape, _PADROES_FAKE)), re.IGNORECASE)
+_FATO_RE = re.compile('|'.join(map(re.escape, _PADROES_FATO)), re.IGNORECASE)
+_FAKE_ISOLADO_RE = re.compile(r'\bfake\b', re.IGNORECASE)
+_FATO_ISOLADO_RE = re.compile(r'\bfato\b', re.IGNORECASE)
+
+# Tabela única de classificação: a primeira expressão que encontrar o título define o rótulo
+_CLASSIFICADORES = (
+    (_FAKE_RE, 'FAKE'),
+    (_FATO_RE, 'FATO'),
+    (_FAKE_ISOLADO_RE, 'FAKE'),  # apenas "fake" isolado
+    (_FATO_ISOLADO_RE, 'FATO')   # apenas "fato" isolado
+)
+
+# Namespaces usados nos feeds RSS
+_NS_MEDIA = '{http://search.yahoo.com/mrss/}'
+_NS_CONTENT = '{http://purl.org/rss/1.0/modules/content/}'
+_NS_DC = '{http://purl.org/dc/elements/1.1/}'
+
+# Filtros para montar apenas as partes do HTML que são efetivamente usadas
+# (o atributo class é comparado por classe, como no seletor CSS: durante o parse
+# o SoupStrainer recebe o valor bruto, que pode ter várias classes ou espaços)
+_CONTEUDO_STRAINER = SoupStrainer(class_=lambda c: c is not None and 'content-text__container' in c.split())
+_ARTIGO_STRAINER = SoupStrainer('article')
+_IMG_STRAINER = SoupStrainer('img')
+
+# Fusos horários por abreviação que podem aparecer nas datas do feed (offset em segundos)
+_TZINFOS = {
+    'BRT': -3 * 3600,
+    'BRST': -2 * 3600,
+    'GMT': 0,
+    'UTC': 0,
+    'UT': 0,
+    'Z': 0
+}
+
+# Abaixo deste número de notícias (ou com uma única CPU) o parsing é feito no
+# próprio processo, já que iniciar o pool custaria mais do que o trabalho distribuído
+_MIN_NOTICIAS_POOL = 32
+
+def _parse_article_html(html):
+    """
+    Extrai o texto principal de uma notícia a partir do HTML da página.
+    
+    Definida no nível do módulo para poder ser executada em um pool de processos.
+    
+    Parâmetros:
+    html (bytes): HTML da página da notícia
+    
+    Retorna:
+    str: Conteúdo da notícia
+    """
+    # Montar apenas o contêiner de texto da notícia
+    # Ajuste os seletores conforme necessário para corresponder à estrutura da página
+    soup = BeautifulSoup(html, 'lxml', parse_only=_CONTEUDO_STRAINER)
+    conteudo_elements = soup.select('.content-text__container p')
+    
+    if conteudo_elements:
+        return ' '.join([p.get_text().strip() for p in conteudo_elements])
+    else:
+        # Tentar outros seletores comuns
+        soup = BeautifulSoup(html, 'lxml', parse_only=_ARTIGO_STRAINER)
+        conteudo_elements = soup.select('article p')
+        if conteudo_elements:
+            return ' '.join([p.get_text().strip() for p in conteudo_elements])
+    
+    return ""
+
+def _parse_article_html_seguro(html):
+    """
+    Executa _parse_article_html sem propagar erros, para que uma notícia com HTML
+    problemático não interrompa o processamento das demais.
+    
+    Parâmetros:
+    html (bytes): HTML da página da notícia
+    
+    Retorna:
+    str: Conteúdo da notícia, ou string vazia em caso de erro
+    """
+    try:
+        return _parse_article_html(html)
+    except Exception as e:
+        print(f"Erro ao processar o HTML de uma notícia: {e}")
+        return ""
 
 class FatoOuFakeAPIExtractor:
     """
@@ -22,25 +158,85 @@ class FatoOuFakeAPIExtractor:
         self.base_url = "https://g1.globo.com/fato-ou-fake/"
         self.rss_url = "https://g1.globo.com/rss/g1/fato-ou-fake/"  # URL potencial do feed RSS
         self.api_url = "https://api.globo.com/fato-ou-fake"  # URL potencial da API
-        self.dataset = []
+        self.dataset = {}
+        
+        # Criar pasta 'datasets' se não existir (usada para os arquivos gerados e de estado)
+        os.makedirs('datasets', exist_ok=True)
+        
+        # Estado do feed RSS da última execução, usado para requisições condicionais
+        self.rss_state_path = 'datasets/.rss_state.json'
+        self._last_etag = None
+        self._last_modified = None
+        self._cached_noticias = {}
+        self._carregar_estado_rss()
+        
+        # Cache em disco do conteúdo já extraído das notícias, indexado pela URL
+        self.conteudo_cache_path = 'datasets/.conteudo_cache'
+        
+        # Sinaliza, durante a corrida entre API e RSS, que um dos métodos já retornou notícias
+        self._encerrar = threading.Event()
+        
+        # Sessão HTTP reaproveitada entre as requisições (keep-alive)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,application/json;q=0.8,*/*;q=0.7'
+        })
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry))
+    
+    def close(self):
+        """
+        Fecha a sessão HTTP e libera as conexões abertas.
+        """
+        self.session.close()
+    
+    def _carregar_estado_rss(self):
+        """
+        Carrega o ETag, o Last-Modified e as notícias da última leitura do feed RSS.
+        """
+        if not os.path.exists(self.rss_state_path):
+            return
+        
+        try:
+            with open(self.rss_state_path, 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar o estado do feed RSS: {e}")
+            return
+        
+        self._last_etag = estado.get('etag')
+        self._last_modified = estado.get('modified')
+        self._cached_noticias = estado.get('colunas', {})
+    
+    def _salvar_estado_rss(self, etag, modified, noticias):
+        """
+        Persiste o ETag, o Last-Modified e as notícias da leitura atual do feed RSS.
+        
+        Parâmetros:
+        etag (str): Valor do cabeçalho ETag da resposta
+        modified (str): Valor do cabeçalho Last-Modified da resposta
+        noticias (dict): Notícias extraídas do feed, organizadas por coluna
+        """
+        self._last_etag = etag
+        self._last_modified = modified
+        self._cached_noticias = noticias
+        
+        with open(self.rss_state_path, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'modified': modified, 'colunas': noticias}, f, ensure_ascii=False)
         
     def tentar_api(self):
         """
         Tenta extrair dados através da API do G1 (se disponível).
         
         Retorna:
-        list: Lista de notícias extraídas ou lista vazia se falhar
+        dict: Notícias extraídas, organizadas por coluna, ou dicionário vazio se falhar
         """
         print("Tentando acessar dados via API...")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json'
-        }
-        
         try:
             # Esta é uma URL hipotética - precisaria ser ajustada conforme documentação real da API
-            response = requests.get(self.api_url, headers=headers)
+            response = self.session.get(self.api_url, headers={'Accept': 'application/json'}, timeout=(5, 15))
             
             if response.status_code == 200:
                 # Tentar extrair os dados JSON
@@ -48,122 +244,283 @@ class FatoOuFakeAPIExtractor:
                 
                 # Processar os dados conforme a estrutura da API
                 # Essa estrutura dependeria da documentação real da API
-                noticias = []
-                
                 # Exemplo hipotético de como seria o processamento
-                if 'items' in data:
-                    for item in data['items']:
-                        noticia = {
-                            'titulo': item.get('title', ''),
-                            'link': item.get('url', ''),
-                            'data_publicacao': item.get('published', ''),
-                            'resumo': item.get('summary', ''),
-                            'classificacao': self._classificar_checagem_api(item),
-                            'imagem_url': item.get('image', {}).get('url', ''),
-                            'conteudo': item.get('content', ''),
-                            'tags': item.get('tags', []),
-                            'autor': item.get('author', ''),
-                            'data_extracao': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'fonte': 'API'
-                        }
-                        noticias.append(noticia)
+                itens = data.get('items', [])
+                
+                # Data e hora da extração, comum a todas as notícias desta execução
+                data_extracao = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                # Montar uma lista por coluna, em vez de um dicionário por notícia
+                noticias = {
+                    'titulo': [item.get('title', '') for item in itens],
+                    'link': [item.get('url', '') for item in itens],
+                    'data_publicacao': [item.get('published', '') for item in itens],
+                    'resumo': [item.get('summary', '') for item in itens],
+                    'classificacao': [self._classificar_checagem_api(item) for item in itens],
+                    'imagem_url': [item.get('image', {}).get('url', '') for item in itens],
+                    'conteudo': [item.get('content', '') for item in itens],
+                    'tags': [item.get('tags', []) for item in itens],
+                    'autor': [item.get('author', '') for item in itens],
+                    'data_extracao': [data_extracao] * len(itens),
+                    'fonte': ['API'] * len(itens)
+                }
                 
-                print(f"Extraídas {len(noticias)} notícias via API.")
+                print(f"Extraídas {len(itens)} notícias via API.")
                 return noticias
                 
             else:
                 print(f"Falha ao acessar API. Status code: {response.status_code}")
-                return []
+                return {}
                 
         except Exception as e:
             print(f"Erro ao tentar acessar API: {e}")
-            return []
+            return {}
     
     def tentar_rss(self):
         """
         Tenta extrair dados através do feed RSS do G1 (se disponível).
         
         Retorna:
-        list: Lista de notícias extraídas ou lista vazia se falhar
+        dict: Notícias extraídas, organizadas por coluna, ou dicionário vazio se falhar
         """
         print("Tentando acessar dados via RSS...")
         
+        # Enviar uma requisição condicional para não baixar o feed se ele não mudou
+        headers = {}
+        if self._cached_noticias.get('link'):
+            if self._last_etag:
+                headers['If-None-Match'] = self._last_etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+        
         try:
-            # Usar feedparser para processar o feed RSS
-            feed = feedparser.parse(self.rss_url)
+            # Processar o feed RSS de forma incremental, sem carregar o corpo inteiro em memória
+            with self.session.get(self.rss_url, headers=headers, stream=True, timeout=(5, 15)) as response:
+                nao_modificado = response.status_code == 304
+                
+                entries = []
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    try:
+                        entries = list(self._parse_rss_stream(response.raw))
+                    except ElementTree.ParseError as e:
+                        print(f"Erro ao processar o XML do feed RSS: {e}")
+                    
+                    # Se a estrutura do feed mudou, recorrer ao feedparser
+                    if not entries:
+                        print("Nenhum item encontrado na leitura direta do feed. Tentando via feedparser...")
+                        entries = self._parse_rss_feedparser()
+                
+                etag = response.headers.get('ETag')
+                modified = response.headers.get('Last-Modified')
+            
+            if nao_modificado:
+                print(f"Feed RSS não foi alterado. Reutilizando {len(self._cached_noticias['link'])} notícias da última leitura.")
+                return self._reaproveitar_noticias_rss()
             
             # Verificar se o feed foi processado com sucesso
-            if feed.status == 200 and feed.entries:
+            if entries:
                 print("Connectado ao feed RSS iniciando processamento...")
-                noticias = []
                 
-                for entry in feed.entries:
-                    # Determinar se é uma checagem Fato ou Fake
-                    if not self._eh_checagem_fato_ou_fake(entry.title, entry.link):
-                        continue
-                    
-                    # Extrair conteúdo completo da notícia
-                    conteudo = self._extrair_conteudo_da_noticia(entry.link)
-                    
+                # Determinar quais entradas são checagens Fato ou Fake
+                entries = [entry for entry in entries
+                           if self._eh_checagem_fato_ou_fake(entry['titulo'], entry['link'])]
+                
+                # Se a API já retornou as notícias, não baixar o conteúdo nem alterar o estado do RSS
+                if self._encerrar.is_set():
+                    print("Notícias já obtidas via API. Interrompendo o processamento do RSS.")
+                    return {}
+                
+                # Extrair o conteúdo completo de todas as notícias de forma concorrente
+                links = [entry['link'] for entry in entries]
+                conteudos = asyncio.run(self._fetch_all_contents(links))
+                
+                # Data e hora da extração, comum a todas as notícias desta execução
+                data_extracao = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                # Montar uma lista por coluna, em vez de um dicionário por notícia
+                noticias = {
+                    'titulo': [entry['titulo'] for entry in entries],
+                    'link': links,
+                    'data_publicacao': [entry['data_publicacao'] for entry in entries],
+                    'resumo': [entry['resumo'] for entry in entries],
                     # Classificar como FATO ou FAKE
-                    classificacao = self._classificar_checagem(entry.title, entry.summary if hasattr(entry, 'summary') else '')
-                    
-                    noticia = {
-                        'titulo': entry.title,
-                        'link': entry.link,
-                        'data_publicacao': entry.published if hasattr(entry, 'published') else '',
-                        'resumo': entry.summary if hasattr(entry, 'summary') else '',
-                        'classificacao': classificacao,
-                        'imagem_url': self._extrair_imagem_do_feed(entry),
-                        'conteudo': conteudo,
-                        'tags': [tag.term for tag in entry.tags] if hasattr(entry, 'tags') else [],
-                        'autor': entry.author if hasattr(entry, 'author') else '',
-                        'data_extracao': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'fonte': 'RSS'
-                    }
-                    
-                    noticias.append(noticia)
+                    'classificacao': [self._classificar_checagem(entry['titulo'], entry['resumo']) for entry in entries],
+                    'imagem_url': [entry['imagem_url'] for entry in entries],
+                    'conteudo': conteudos,
+                    'tags': [entry['tags'] for entry in entries],
+                    'autor': [entry['autor'] for entry in entries],
+                    'data_extracao': [data_extracao] * len(entries),
+                    'fonte': ['RSS'] * len(entries)
+                }
+                
+                print(f"Extraídas {len(entries)} notícias via RSS.")
+                
+                # Guardar o estado para a próxima requisição condicional
+                if entries and (etag or modified):
+                    self._salvar_estado_rss(etag, modified, noticias)
                 
-                print(f"Extraídas {len(noticias)} notícias via RSS.")
                 return noticias
                 
             else:
                 print(f"Feed RSS não disponível ou vazio.")
-                return []
+                return {}
                 
         except Exception as e:
             print(f"Erro ao tentar acessar feed RSS: {e}")
-            return []
+            return {}
+    
+    def _reaproveitar_noticias_rss(self):
+        """
+        Prepara as notícias da última leitura do feed RSS para reuso quando o feed não mudou:
+        atualiza a data de extração e tenta de novo baixar os conteúdos que ficaram vazios.
+        
+        Retorna:
+        dict: Notícias organizadas por coluna, ou dicionário vazio se a API já retornou notícias
+        """
+        if self._encerrar.is_set():
+            print("Notícias já obtidas via API. Interrompendo o processamento do RSS.")
+            return {}
+        
+        noticias = {coluna: list(valores) for coluna, valores in self._cached_noticias.items()}
+        
+        # Tentar novamente as notícias cujo conteúdo não pôde ser extraído antes
+        vazios = [i for i, conteudo in enumerate(noticias['conteudo']) if not conteudo]
+        if vazios:
+            print(f"Tentando novamente extrair o conteúdo de {len(vazios)} notícias.")
+            conteudos = asyncio.run(self._fetch_all_contents([noticias['link'][i] for i in vazios]))
+            for i, conteudo in zip(vazios, conteudos):
+                noticias['conteudo'][i] = conteudo
+        
+        # Data e hora da extração, comum a todas as notícias desta execução
+        data_extracao = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        noticias['data_extracao'] = [data_extracao] * len(noticias['link'])
+        
+        self._salvar_estado_rss(self._last_etag, self._last_modified, noticias)
+        return noticias
     
-    def _extrair_imagem_do_feed(self, entry):
+    def _parse_rss_stream(self, stream):
         """
-        Extrai a URL da imagem de uma entrada do feed RSS.
+        Percorre um feed RSS de forma incremental, item a item.
         
         Parâmetros:
-        entry: Entrada do feed RSS
+        stream: Objeto de arquivo com o XML do feed
+        
+        Retorna:
+        generator: Dicionários com os campos de cada item do feed
+        """
+        for _, elem in ElementTree.iterparse(stream, events=('end',)):
+            if elem.tag != 'item':
+                continue
+            
+            autor = elem.findtext('author') or elem.findtext(f'{_NS_DC}creator') or ''
+            
+            yield {
+                'titulo': (elem.findtext('title') or '').strip(),
+                'link': (elem.findtext('link') or '').strip(),
+                'data_publicacao': self._normalizar_data(elem.findtext('pubDate') or ''),
+                'resumo': elem.findtext('description') or '',
+                'imagem_url': self._extrair_imagem_do_feed(elem),
+                'tags': [(categoria.text or '').strip() for categoria in elem.findall('category')],
+                'autor': autor.strip()
+            }
+            
+            # Liberar a memória do item já processado
+            elem.clear()
+    
+    def _parse_rss_feedparser(self):
+        """
+        Lê o feed RSS com o feedparser, mais lento porém tolerante a variações de formato.
+        
+        Retorna:
+        list: Dicionários com os campos de cada item do feed
+        """
+        feed = feedparser.parse(self.rss_url, agent=self.session.headers['User-Agent'])
+        
+        return [{
+            'titulo': entry.get('title', '').strip(),
+            'link': entry.get('link', '').strip(),
+            'data_publicacao': self._normalizar_data(entry.get('published', '')),
+            'resumo': entry.get('summary', ''),
+            'imagem_url': self._extrair_imagem_da_entrada(entry),
+            'tags': [tag.term for tag in entry.get('tags', [])],
+            'autor': entry.get('author', '')
+        } for entry in feed.entries]
+    
+    def _extrair_imagem_da_entrada(self, entry):
+        """
+        Extrai a URL da imagem de uma entrada do feedparser.
+        
+        Parâmetros:
+        entry: Entrada do feed RSS processada pelo feedparser
         
         Retorna:
         str: URL da imagem ou string vazia
         """
         # Tentar diferentes locais onde a imagem pode estar no feed
-        if hasattr(entry, 'media_content') and entry.media_content:
-            for media in entry.media_content:
-                if 'url' in media:
-                    return media['url']
-        
-        if hasattr(entry, 'links'):
-            for link in entry.links:
-                if link.get('type', '').startswith('image/'):
-                    return link.get('href', '')
-        
-        if hasattr(entry, 'content') and entry.content:
-            for content in entry.content:
-                if 'value' in content:
-                    # Procurar URLs de imagem no conteúdo HTML
-                    soup = BeautifulSoup(content['value'], 'html.parser')
-                    img = soup.find('img')
-                    if img and 'src' in img.attrs:
-                        return img['src']
+        for media in entry.get('media_content', []):
+            if 'url' in media:
+                return media['url']
+        
+        for link in entry.get('links', []):
+            if link.get('type', '').startswith('image/'):
+                return link.get('href', '')
+        
+        for content in entry.get('content', []):
+            if 'value' in content:
+                # Procurar URLs de imagem no conteúdo HTML
+                soup = BeautifulSoup(content['value'], 'lxml', parse_only=_IMG_STRAINER)
+                img = soup.find('img')
+                if img and 'src' in img.attrs:
+                    return img['src']
+        
+        return ''
+    
+    def _normalizar_data(self, data):
+        """
+        Converte a data de publicação do feed para o formato ISO 8601.
+        
+        Parâmetros:
+        data (str): Data de publicação como aparece no feed
+        
+        Retorna:
+        str: Data no formato ISO 8601, ou o texto original se não for reconhecida
+        """
+        data = data.strip()
+        if not data:
+            return ''
+        
+        try:
+            return dtparser.parse(data, tzinfos=_TZINFOS).isoformat()
+        except (ValueError, OverflowError):
+            return data
+    
+    def _extrair_imagem_do_feed(self, item):
+        """
+        Extrai a URL da imagem de um item do feed RSS.
+        
+        Parâmetros:
+        item (Element): Elemento <item> do feed RSS
+        
+        Retorna:
+        str: URL da imagem ou string vazia
+        """
+        # Tentar diferentes locais onde a imagem pode estar no feed
+        for media in item.iter(f'{_NS_MEDIA}content'):
+            if media.get('url'):
+                return media.get('url')
+        
+        for enclosure in item.findall('enclosure'):
+            if enclosure.get('type', '').startswith('image/'):
+                return enclosure.get('url', '')
+        
+        for html in (item.findtext(f'{_NS_CONTENT}encoded'), item.findtext('description')):
+            if html:
+                # Procurar URLs de imagem no conteúdo HTML
+                soup = BeautifulSoup(html, 'lxml', parse_only=_IMG_STRAINER)
+                img = soup.find('img')
+                if img and 'src' in img.attrs:
+                    return img['src']
         
         return ''
     
@@ -178,17 +535,8 @@ class FatoOuFakeAPIExtractor:
         Retorna:
         bool: True se for uma checagem, False caso contrário
         """
-        # Verificar pelo link se contém 'fato-ou-fake'
-        if 'fato-ou-fake' in link.lower():
-            return True
-        
-        # Verificar por palavras-chave no título
-        keywords = ['fato', 'fake', 'falso', 'verdade', 'é falso que', 'é verdade que', 'checamos']
-        for keyword in keywords:
-            if keyword.lower() in titulo.lower():
-                return True
-        
-        return False
+        # Verificar pelo link se contém 'fato-ou-fake' ou por palavras-chave no título
+        return bool(_LINK_CHECAGEM_RE.search(link) or _CHECAGEM_RE.search(titulo))
     
     def _classificar_checagem(self, titulo, resumo):
         """
@@ -201,58 +549,10 @@ class FatoOuFakeAPIExtractor:
         Retorna:
         str: 'FATO', 'FAKE' ou 'INDETERMINADO'
         """
-        # Considerar apenas o título para a classificação
-        texto_titulo = titulo.lower()
-        
-        # Padrões comuns usados pelo G1 para indicar FAKE no título
-        padroes_fake = [
-            'é fake',
-            'é falso', 
-            'não é verdade', 
-            'não é verdadeiro',
-            'falso que', 
-            'fake news',
-            'boato', 
-            'mentira', 
-            'enganoso', 
-            'não é real', 
-            'não aconteceu',
-            'não procede',
-            'não existe',
-            'não é fato'
-        ]
-        
-        # Padrões comuns usados pelo G1 para indicar FATO no título
-        padroes_fato = [
-            'é fato', 
-            'é verdade', 
-            'verdadeiro', 
-            'aconteceu', 
-            'é real',
-            'confirmado', 
-            'verificado', 
-            'comprovado',
-            'procede',
-            'é verdadeiro'
-        ]
-        
-        # Verificar se é FAKE
-        for padrao in padroes_fake:
-            if padrao in texto_titulo:
-                return 'FAKE'
-        
-        # Verificar se é FATO
-        for padrao in padroes_fato:
-            if padrao in texto_titulo:
-                return 'FATO'
-        
-        # Verificar se é FAKE com base em apenas "fake" isolado
-        if re.search(r'\bfake\b', texto_titulo, re.IGNORECASE):
-            return 'FAKE'
-            
-        # Verificar se é FATO com base em apenas "fato" isolado
-        if re.search(r'\bfato\b', texto_titulo, re.IGNORECASE):
-            return 'FATO'
+        # Considerar apenas o título para a classificação, com FAKE tendo prioridade sobre FATO
+        for expressao, rotulo in _CLASSIFICADORES:
+            if expressao.search(titulo):
+                return rotulo
         
         # Se não foi possível determinar com certeza
         return 'INDETERMINADO'
@@ -279,46 +579,78 @@ class FatoOuFakeAPIExtractor:
         
         return self._classificar_checagem(titulo, resumo)
     
-    def _extrair_conteudo_da_noticia(self, url):
+    async def _fetch_all_contents(self, urls):
         """
-        Extrai o conteúdo completo de uma notícia a partir da URL.
+        Extrai de forma concorrente o conteúdo completo de várias notícias.
         
         Parâmetros:
-        url (str): URL da notícia
+        urls (list): Lista de URLs das notícias
         
         Retorna:
-        str: Conteúdo da notícia
+        list: Conteúdos das notícias, na mesma ordem das URLs (string vazia em caso de erro)
         """
-        try:
-            # Adicionar um delay para evitar sobrecarga de requisições
-            time.sleep(random.uniform(1, 3))
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extrair o conteúdo principal da notícia
-            # Ajuste os seletores conforme necessário para corresponder à estrutura da página
-            conteudo_elements = soup.select('.content-text__container p')
+        # Limitar o número de requisições simultâneas para não sobrecarregar o servidor
+        semaforo = asyncio.Semaphore(20)
+        
+        async def fetch_one(session, url):
+            async with semaforo:
+                # Adicionar um pequeno delay para espaçar as requisições
+                await asyncio.sleep(random.uniform(0.1, 0.5))
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+        
+        with shelve.open(self.conteudo_cache_path) as cache:
+            # Baixar apenas as notícias que ainda não estão no cache
+            pendentes = [url for url in dict.fromkeys(urls) if url not in cache]
             
-            if conteudo_elements:
-                return ' '.join([p.get_text().strip() for p in conteudo_elements])
-            else:
-                # Tentar outros seletores comuns
-                conteudo_elements = soup.select('article p')
-                if conteudo_elements:
-                    return ' '.join([p.get_text().strip() for p in conteudo_elements])
-            
-            return ""
+            if pendentes:
+                connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+                timeout = aiohttp.ClientTimeout(total=20)
+                async with aiohttp.ClientSession(headers=dict(self.session.headers),
+                                                 connector=connector, timeout=timeout) as session:
+                    tasks = [fetch_one(session, url) for url in pendentes]
+                    resultados = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                baixadas = []
+                for url, resultado in zip(pendentes, resultados):
+                    if isinstance(resultado, Exception):
+                        print(f"Erro ao extrair conteúdo da notícia {url}: {resultado}")
+                    else:
+                        baixadas.append((url, resultado))
+                
+                # O parsing do HTML é limitado pela CPU: distribuí-lo entre processos
+                if baixadas:
+                    conteudos = self._parse_conteudos([html for _, html in baixadas])
+                    
+                    for (url, _), conteudo in zip(baixadas, conteudos):
+                        if conteudo:
+                            cache[url] = conteudo
             
-        except Exception as e:
-            print(f"Erro ao extrair conteúdo da notícia {url}: {e}")
-            return ""
+            return [cache.get(url, "") for url in urls]
+    
+    def _parse_conteudos(self, htmls):
+        """
+        Extrai o texto de várias páginas de notícias, usando um pool de processos
+        para lotes grandes quando há mais de uma CPU disponível.
+        
+        Parâmetros:
+        htmls (list): HTML das páginas das notícias
+        
+        Retorna:
+        list: Conteúdos das notícias, na mesma ordem (string vazia em caso de erro)
+        """
+        if len(htmls) >= _MIN_NOTICIAS_POOL and (os.cpu_count() or 1) >= 2:
+            try:
+                # 'spawn' explícito: este método roda dentro de threads, e um fork
+                # de um processo com várias threads pode travar os processos filhos
+                contexto = multiprocessing.get_context('spawn')
+                with concurrent.futures.ProcessPoolExecutor(mp_context=contexto) as pool:
+                    return list(pool.map(_parse_article_html_seguro, htmls, chunksize=16))
+            except Exception as e:
+                print(f"Erro no pool de processos ({e}). Processando as notícias no processo atual...")
+        
+        return [_parse_article_html_seguro(html) for html in htmls]
     
     def executar_extracao(self):
         """
@@ -329,22 +661,38 @@ class FatoOuFakeAPIExtractor:
         """
         print(f"Iniciando extração de notícias Fato ou Fake do G1 via API/RSS...")
         
-        # Tentar primeiro via API
-        noticias = self.tentar_api()
+        # Tentar via API e via RSS ao mesmo tempo; a primeira que retornar notícias é usada
+        noticias = {}
+        self._encerrar.clear()
+        ex = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        futures = [ex.submit(self.tentar_api), ex.submit(self.tentar_rss)]
         
-        # Se a API falhar, tentar via RSS
-        if not noticias:
-            noticias = self.tentar_rss()
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                noticias = future.result()
+                if noticias.get('link'):
+                    # Avisar o outro método para não prosseguir com a extração
+                    self._encerrar.set()
+                    break
+        finally:
+            # Não esperar pelo método perdedor; a sessão só é fechada quando ambos terminarem
+            def fechar_sessao(_):
+                if all(f.done() for f in futures):
+                    self.close()
+            
+            ex.shutdown(wait=False)
+            for future in futures:
+                future.add_done_callback(fechar_sessao)
         
         # Se ambos falharem, avisar e retornar DataFrame vazio
-        if not noticias:
+        if not noticias.get('link'):
             print("Não foi possível extrair dados via API ou RSS. Considere usar o método de scraping direto.")
             return pd.DataFrame()
         
-        # Atribuir ao dataset
+        # Atribuir ao dataset (uma lista por coluna)
         self.dataset = noticias
         
-        # Converter para DataFrame
+        # Converter para DataFrame diretamente a partir das colunas
         df = pd.DataFrame(noticias)
         
         print(f"Total de {len(df)} notícias extraídas com sucesso.")
@@ -365,19 +713,19 @@ class FatoOuFakeAPIExtractor:
             print("Dataset vazio. Nada para salvar.")
             return None
         
-        # Criar pasta 'datasets' se não existir
-        if not os.path.exists('datasets'):
-            os.makedirs('datasets')
-        
         # Gerar nome do arquivo com timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if formato.lower() == 'csv':
             filepath = f'datasets/fato_ou_fake_api_{timestamp}.csv'
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            # Listas (ex.: tags) não são suportadas pelo escritor CSV do PyArrow
+            df_csv = df.astype({'tags': str}) if 'tags' in df.columns else df
+            pacsv.write_csv(pa.Table.from_pandas(df_csv, preserve_index=False), filepath)
         elif formato.lower() == 'json':
             filepath = f'datasets/fato_ou_fake_api_{timestamp}.json'
-            df.to_json(filepath, orient='records', force_ascii=False, indent=4)
+            registros = df.to_dict(orient='records')
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(registros, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
         else:
             raise ValueError(f"Formato '{formato}' não suportado. Use 'csv' ou 'json'.")
         
@@ -396,9 +744,11 @@ if __name__ == "__main__":
     if not df_noticias.empty:
         # Exibir estatísticas básicas
         total_noticias = len(df_noticias)
-        total_fake = len(df_noticias[df_noticias['classificacao'] == 'FAKE'])
-        total_fato = len(df_noticias[df_noticias['classificacao'] == 'FATO'])
-        total_indeterminado = len(df_noticias[df_noticias['classificacao'] == 'INDETERMINADO'])
+        # Contar todas as classificações em uma única passagem
+        contagens = df_noticias['classificacao'].value_counts()
+        total_fake = contagens.get('FAKE', 0)
+        total_fato = contagens.get('FATO', 0)
+        total_indeterminado = contagens.get('INDETERMINADO', 0)
         
         print(f"\nEstatísticas do Dataset:")
         print(f"Total de notícias: {total_noticias}")
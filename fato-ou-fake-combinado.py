@@ -2,6 +2,10 @@ import pandas as pd
 import os
 from datetime import datetime
 import argparse
+import concurrent.futures
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import orjson
 
 # Importar as classes dos outros scripts
 # Nota: Esses scripts devem estar no mesmo diretório
@@ -27,6 +31,9 @@ class ExtratorCombinado:
         self.scraper = None
         self.api_extractor = None
         
+        # Criar pasta 'datasets' se não existir
+        os.makedirs('datasets', exist_ok=True)
+        
         # Validar o método
         if self.metodo not in ['scraping', 'api', 'todos']:
             raise ValueError("Método inválido. Use 'scraping', 'api' ou 'todos'.")
@@ -45,64 +52,88 @@ class ExtratorCombinado:
         Retorna:
         DataFrame: DataFrame pandas com todas as notícias extraídas
         """
-        dfs = []
+        fontes = []
         
-        # Extrair via scraping se aplicável
-        if self.scraper:
-            print("\n[COMBINADO] Iniciando extração via scraping...")
-            df_scraping = self.scraper.executar_extracao()
+        # Executar os extratores em paralelo, já que acessam endpoints diferentes
+        # e não compartilham estado
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+            futures = {}
+            extratores = {}
             
-            if not df_scraping.empty:
-                # Adicionar coluna para identificar a fonte dos dados
-                df_scraping['metodo_extracao'] = 'scraping'
-                dfs.append(df_scraping)
-                
-                print(f"[COMBINADO] Scraping: {len(df_scraping)} notícias")
-            else:
-                print("[COMBINADO] Scraping: nenhuma notícia extraída")
-        
-        # Extrair via API/RSS se aplicável
-        if self.api_extractor:
-            print("\n[COMBINADO] Iniciando extração via API/RSS...")
-            df_api = self.api_extractor.executar_extracao()
+            # Extrair via scraping se aplicável
+            if self.scraper:
+                print("\n[COMBINADO] Iniciando extração via scraping...")
+                futures['scraping'] = ex.submit(self.scraper.executar_extracao)
+                extratores['scraping'] = self.scraper
+            
+            # Extrair via API/RSS se aplicável
+            if self.api_extractor:
+                print("\n[COMBINADO] Iniciando extração via API/RSS...")
+                futures['api/rss'] = ex.submit(self.api_extractor.executar_extracao)
+                extratores['api/rss'] = self.api_extractor
+            
+            metodos = {future: metodo for metodo, future in futures.items()}
+            rotulos = {'scraping': 'Scraping', 'api/rss': 'API/RSS'}
+            resultados = {}
             
-            if not df_api.empty:
-                # Adicionar coluna para identificar a fonte dos dados
-                df_api['metodo_extracao'] = 'api/rss'
-                dfs.append(df_api)
+            for future in concurrent.futures.as_completed(futures.values()):
+                metodo = metodos[future]
+                df_metodo = future.result()
                 
-                print(f"[COMBINADO] API/RSS: {len(df_api)} notícias")
-            else:
-                print("[COMBINADO] API/RSS: nenhuma notícia extraída")
-        
-        # Combinar os DataFrames, se houver mais de um
-        if len(dfs) > 1:
+                if not df_metodo.empty:
+                    # Usar as colunas do extrator, adicionando a que identifica a fonte dos dados
+                    colunas = dict(extratores[metodo].dataset)
+                    colunas['metodo_extracao'] = [metodo] * len(colunas['link'])
+                    resultados[metodo] = colunas
+                    
+                    print(f"[COMBINADO] {rotulos[metodo]}: {len(df_metodo)} notícias")
+                else:
+                    print(f"[COMBINADO] {rotulos[metodo]}: nenhuma notícia extraída")
+        
+        # Manter a ordem original (scraping antes de API/RSS) para a remoção de duplicatas
+        for metodo in futures:
+            if metodo in resultados:
+                fontes.append(resultados[metodo])
+        
+        # Combinar as fontes, se houver mais de uma
+        if len(fontes) > 1:
             # Verificar para garantir que as colunas sejam compatíveis
-            colunas_comuns = set(dfs[0].columns).intersection(set(dfs[1].columns))
+            colunas_comuns = [coluna for coluna in fontes[0] if coluna in fontes[1]]
             
             # Se houver colunas incompatíveis, usar apenas as comuns
-            if len(colunas_comuns) < len(dfs[0].columns) or len(colunas_comuns) < len(dfs[1].columns):
+            if len(colunas_comuns) < len(fontes[0]) or len(colunas_comuns) < len(fontes[1]):
                 print(f"[COMBINADO] Ajustando colunas incompatíveis ({len(colunas_comuns)} colunas comuns)")
-                dfs = [df[list(colunas_comuns)] for df in dfs]
             
-            # Concatenar os DataFrames
-            df_combinado = pd.concat(dfs, ignore_index=True)
+            # Remover duplicatas com base no link (URL), mantendo a primeira ocorrência
+            combinado = {coluna: [] for coluna in colunas_comuns}
+            links_vistos = set()
+            total_noticias = 0
             
-            # Remover duplicatas com base no link (URL)
-            df_combinado_sem_duplicatas = df_combinado.drop_duplicates(subset=['link'])
+            for fonte in fontes:
+                indices = []
+                for i, link in enumerate(fonte['link']):
+                    if link not in links_vistos:
+                        links_vistos.add(link)
+                        indices.append(i)
+                
+                total_noticias += len(fonte['link'])
+                for coluna in colunas_comuns:
+                    valores = fonte[coluna]
+                    combinado[coluna].extend(valores[i] for i in indices)
             
             # Verificar quantas duplicatas foram removidas
-            num_duplicatas = len(df_combinado) - len(df_combinado_sem_duplicatas)
+            num_duplicatas = total_noticias - len(links_vistos)
             if num_duplicatas > 0:
                 print(f"[COMBINADO] Removidas {num_duplicatas} notícias duplicadas")
             
-            return df_combinado_sem_duplicatas
+            # Construir o DataFrame uma única vez, apenas com as colunas comuns
+            return pd.DataFrame(combinado)
         
-        # Se houver apenas um DataFrame, retorná-lo
-        elif len(dfs) == 1:
-            return dfs[0]
+        # Se houver apenas uma fonte, convertê-la
+        elif len(fontes) == 1:
+            return pd.DataFrame(fontes[0])
         
-        # Se não houver nenhum DataFrame, retornar um vazio
+        # Se não houver nenhuma fonte, retornar um DataFrame vazio
         else:
             print("[COMBINADO] Nenhum dado extraído")
             return pd.DataFrame()
@@ -122,19 +153,19 @@ class ExtratorCombinado:
             print("[COMBINADO] Dataset vazio. Nada para salvar.")
             return None
         
-        # Criar pasta 'datasets' se não existir
-        if not os.path.exists('datasets'):
-            os.makedirs('datasets')
-        
         # Gerar nome do arquivo com timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if formato.lower() == 'csv':
             filepath = f'datasets/fato_ou_fake_combinado_{timestamp}.csv'
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            # Listas (ex.: tags) não são suportadas pelo escritor CSV do PyArrow
+            df_csv = df.astype({'tags': str}) if 'tags' in df.columns else df
+            pacsv.write_csv(pa.Table.from_pandas(df_csv, preserve_index=False), filepath)
         elif formato.lower() == 'json':
             filepath = f'datasets/fato_ou_fake_combinado_{timestamp}.json'
-            df.to_json(filepath, orient='records', force_ascii=False, indent=4)
+            registros = df.to_dict(orient='records')
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(registros, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
         else:
             raise ValueError(f"Formato '{formato}' não suportado. Use 'csv' ou 'json'.")
         
@@ -172,9 +203,11 @@ def main():
     if not df_noticias.empty:
         # Exibir estatísticas básicas
         total_noticias = len(df_noticias)
-        total_fake = len(df_noticias[df_noticias['classificacao'] == 'FAKE'])
-        total_fato = len(df_noticias[df_noticias['classificacao'] == 'FATO'])
-        total_indeterminado = len(df_noticias[df_noticias['classificacao'] == 'INDETERMINADO'])
+        # Contar todas as classificações em uma única passagem
+        contagens = df_noticias['classificacao'].value_counts()
+        total_fake = contagens.get('FAKE', 0)
+        total_fato = contagens.get('FATO', 0)
+        total_indeterminado = contagens.get('INDETERMINADO', 0)
         
         print(f"\nEstatísticas do Dataset Combinado:")
         print(f"Total de notícias: {total_noticias}")
@@ -1,10 +1,243 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests_cache
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
 import pandas as pd
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
 import os
+import html
+import concurrent.futures
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import orjson
+
+# Palavras-chave que indicam uma checagem Fato ou Fake no título
+_KEYWORDS_CHECAGEM = ('fato', 'fake', 'falso', 'verdade', 'é falso que', 'é verdade que', 'checamos')
+
+# Padrões comuns usados pelo G1 para indicar FAKE no título
+_PADROES_FAKE = (
+    'é fake',
+    'é falso', 
+    'não é verdade', 
+    'não é verdadeiro',
+    'falso que', 
+    'fake news',
+    'boato', 
+    'mentira', 
+    'enganoso', 
+    'não é real', 
+    'não aconteceu',
+    'não procede',
+    'não existe',
+    'não é fato'
+)
+
+# Padrões comuns usados pelo G1 para indicar FATO no título
+_PADROES_FATO = (
+    'é fato', 
+    'é verdade', 
+    'verdadeiro', 
+    'aconteceu', 
+    'é real',
+    'confirmado', 
+    'verificado', 
+    'comprovado',
+    'procede',
+    'é verdadeiro'
+)
+
+# Expressões pré-compiladas, aplicadas sobre o texto já em minúsculas
+_CHECAGEM_RE = re.compile('|'.join(map(re.escape, _KEYWORDS_CHECAGEM)))
+_FAKE_RE = re.compile('|'.join(map(re.escape, _PADROES_FAKE)))
+_FATO_RE = re.compile('|'.join(map(re.escape, _PADROES_FATO)))
+_FAKE_ISOLADO_RE = re.compile(r'\bfake\b')
+_FATO_ISOLADO_RE = re.compile(r'\bfato\b')
+
+# Tabela única de classificação: a primeira expressão que encontrar o título define o rótulo
+_CLASSIFICADORES = (
+    (_FAKE_RE, 'FAKE'),
+    (_FATO_RE, 'FATO'),
+    (_FAKE_ISOLADO_RE, 'FAKE'),  # apenas "fake" isolado
+    (_FATO_ISOLADO_RE, 'FATO')   # apenas "fato" isolado
+)
+
+# Restringe o parse das páginas de listagem aos blocos de notícia
+# (o atributo class é comparado por classe, como no seletor CSS: durante o parse
+# o SoupStrainer recebe o valor bruto, que pode ter várias classes ou espaços)
+_FEED_POST_STRAINER = SoupStrainer(class_=lambda c: c is not None and 'feed-post-body' in c.split())
+
+# Número de páginas de listagem baixadas em paralelo a cada lote
+_PAGINAS_POR_LOTE = 5
+
+# Colunas do dataset, que é mantido como uma lista por coluna
+_COLUNAS = ('titulo', 'link', 'data_publicacao', 'resumo', 'classificacao', 'imagem_url',
+            'conteudo', 'tags', 'autor', 'data_extracao')
+
+# Expressão usada pelo parser de listagem por busca de substrings para remover tags internas
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Consultas XPath pré-compiladas para a página de detalhes da notícia
+# (equivalentes aos seletores de classe CSS, sem casar nomes de classe parciais)
+_CLASSE = 'contains(concat(" ", normalize-space(@class), " "), " {} ")'
+_XPATH_CONTEUDO = etree.XPath(f'//*[{_CLASSE.format("content-text__container")}]//p')
+_XPATH_TAGS = etree.XPath(f'//*[{_CLASSE.format("entities__list-item")}]')
+_XPATH_AUTOR = etree.XPath(f'(//*[{_CLASSE.format("content-publication-data__from")}])[1]')
+
+def _texto_limpo(trecho):
+    """
+    Remove as tags internas e decodifica as entidades HTML de um trecho.
+    """
+    return html.unescape(_TAG_RE.sub('', trecho)).strip()
+
+def _abertura_por_classe(texto, classe, inicio=0, fim=None):
+    """
+    Localiza o início da tag de abertura do primeiro elemento que tem `classe`
+    entre as classes do seu atributo class (como o class_ do BeautifulSoup).
+    
+    Retorna:
+    int: Posição do '<' da tag, ou -1 se nenhum elemento tiver a classe
+    """
+    fim = len(texto) if fim is None else fim
+    i = texto.find(classe, inicio, fim)
+    while i != -1:
+        antes = texto[i - 1]
+        depois = texto[i + len(classe)] if i + len(classe) < len(texto) else ''
+        atributo = texto.rfind('class="', inicio, i)
+        
+        # Aceitar apenas a classe inteira, dentro de um atributo class ainda aberto
+        if (antes in '" \t\r\n' and depois in '" \t\r\n' and atributo != -1
+                and '"' not in texto[atributo + len('class="'):i]):
+            abertura = texto.rfind('<', inicio, atributo)
+            if abertura == -1:
+                raise ValueError(f"Marcação inesperada ao redor de '{classe}'")
+            return abertura
+        
+        i = texto.find(classe, i + len(classe), fim)
+    return -1
+
+def _fim_do_elemento(texto, abertura):
+    """
+    Localiza o fechamento do elemento cuja tag de abertura começa em `abertura`,
+    considerando elementos de mesmo nome aninhados.
+    
+    Retorna:
+    tuple: (posição logo após a tag de abertura, início da tag de fechamento,
+            posição logo após a tag de fechamento)
+    """
+    nome = re.match(r'<([a-zA-Z][a-zA-Z0-9]*)', texto[abertura:abertura + 32])
+    fim_abertura = texto.find('>', abertura)
+    if not nome or fim_abertura == -1:
+        raise ValueError("Tag de abertura inválida")
+    fim_abertura += 1
+    
+    profundidade = 1
+    padrao = re.compile(r'<(/?)%s[\s>/]' % nome.group(1), re.IGNORECASE)
+    for tag in padrao.finditer(texto, fim_abertura):
+        profundidade += -1 if tag.group(1) else 1
+        if profundidade == 0:
+            inicio_fechamento = tag.start()
+            fim_fechamento = texto.find('>', inicio_fechamento)
+            return fim_abertura, inicio_fechamento, fim_fechamento + 1
+    
+    raise ValueError(f"Elemento <{nome.group(1)}> sem fechamento")
+
+def _elemento_por_classe(bloco, classe):
+    """
+    Localiza o primeiro elemento do bloco que tem a classe informada.
+    
+    Retorna:
+    tuple: (tag de abertura, conteúdo interno do elemento) ou None se não encontrado
+    """
+    abertura = _abertura_por_classe(bloco, classe)
+    if abertura == -1:
+        return None
+    fim_abertura, inicio_fechamento, _ = _fim_do_elemento(bloco, abertura)
+    return bloco[abertura:fim_abertura], bloco[fim_abertura:inicio_fechamento]
+
+def _atributo(tag, nome):
+    """
+    Retorna o valor (entre aspas duplas) de um atributo da tag, ou None.
+    """
+    marcador = f' {nome}="'
+    i = tag.find(marcador)
+    if i == -1:
+        return None
+    i += len(marcador)
+    j = tag.find('"', i)
+    if j == -1:
+        raise ValueError(f"Atributo '{nome}' sem fechamento")
+    return html.unescape(tag[i:j])
+
+def _texto_por_classe(bloco, classe):
+    """
+    Retorna o texto do primeiro elemento do bloco com a classe informada, ou None.
+    """
+    elemento = _elemento_por_classe(bloco, classe)
+    return _texto_limpo(elemento[1]) if elemento else None
+
+def _parse_list_fast(pagina):
+    """
+    Extrai os itens de uma página de listagem tratando o HTML como texto,
+    por busca de substrings, sem construir a árvore do documento.
+    
+    Parâmetros:
+    pagina (bytes): HTML bruto da página de listagem
+    
+    Retorna:
+    list: Lista de dicionários com titulo, link, data_publicacao, resumo e imagem_url,
+          ou None se a marcação não tiver a estrutura esperada
+    """
+    itens = []
+    try:
+        texto = pagina.decode('utf-8')
+        
+        abertura = _abertura_por_classe(texto, 'feed-post-body')
+        while abertura != -1:
+            # Cada bloco vai só até o fechamento do próprio elemento feed-post-body,
+            # para que campos ausentes não sejam buscados na marcação seguinte
+            _, _, fim = _fim_do_elemento(texto, abertura)
+            bloco = texto[abertura:fim]
+            abertura = _abertura_por_classe(texto, 'feed-post-body', fim)
+            
+            link_element = _elemento_por_classe(bloco, 'feed-post-link')
+            if not link_element:
+                continue
+            tag_link, titulo = link_element
+            link = _atributo(tag_link, 'href')
+            if link is None:
+                raise ValueError("Link da notícia sem href")
+            
+            data = _texto_por_classe(bloco, 'feed-post-datetime')
+            resumo = _texto_por_classe(bloco, 'feed-post-body-resumo')
+            
+            # Extrair a imagem apenas de dentro do elemento feed-post-figure
+            imagem_url = ""
+            figura = _elemento_por_classe(bloco, 'feed-post-figure')
+            if figura:
+                img = figura[1].find('<img')
+                if img != -1:
+                    fim_img = figura[1].find('>', img)
+                    if fim_img == -1:
+                        raise ValueError("Tag img sem fechamento")
+                    imagem_url = _atributo(figura[1][img:fim_img + 1], 'src') or ""
+            
+            itens.append({
+                'titulo': _texto_limpo(titulo),
+                'link': link,
+                'data_publicacao': data if data is not None else "Data não encontrada",
+                'resumo': resumo or "",
+                'imagem_url': imagem_url
+            })
+    except (ValueError, UnicodeDecodeError) as e:
+        print(f"[SCRAPER] Estrutura inesperada na listagem, usando BeautifulSoup: {e}")
+        return None
+    
+    return itens or None
 
 class FatoOuFakeScraper:
     """
@@ -12,6 +245,14 @@ class FatoOuFakeScraper:
     e criar um dataset estruturado de checagens de notícias falsas.
     """
     
+    # Cabeçalhos enviados em todas as requisições da sessão; a compressão
+    # reduz bastante o volume de HTML transferido
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept-Encoding': 'gzip, br',
+        'Accept-Language': 'pt-BR,pt;q=0.9'
+    }
+    
     def __init__(self, num_pages=5):
         """
         Inicializa o scraper.
@@ -21,188 +262,232 @@ class FatoOuFakeScraper:
         """
         self.base_url = "https://g1.globo.com/fato-ou-fake/"
         self.num_pages = num_pages
-        self.dataset = []
+        self.dataset = {coluna: [] for coluna in _COLUNAS}
+        
+        # Criar pasta 'datasets' se não existir
+        os.makedirs('datasets', exist_ok=True)
+        
+        # Links já extraídos em execuções anteriores, para não baixá-los de novo
+        self.seen_path = 'datasets/.seen.json'
+        self.seen = set()
+        self._carregar_links_vistos()
+        
+        # Links já enfileirados nesta execução (inclusive os que falharem), para não repeti-los
+        self._links_na_execucao = set()
+        
+        # Sessão HTTP reaproveitada entre as requisições (keep-alive), com cache em disco:
+        # as páginas de listagem expiram em poucas horas, as notícias quase não mudam
+        self.session = requests_cache.CachedSession(
+            'datasets/.http_cache',
+            backend='sqlite',
+            expire_after=timedelta(hours=6),
+            urls_expire_after={'g1.globo.com/*/noticia/*': timedelta(days=30)},
+            allowable_methods=('GET',)
+        )
+        self.session.headers.update(self.HEADERS)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry))
+    
+    def close(self):
+        """
+        Fecha a sessão HTTP e libera as conexões abertas.
+        """
+        self.session.close()
+    
+    def _carregar_links_vistos(self):
+        """
+        Carrega os links das notícias já extraídas em execuções anteriores.
+        """
+        if not os.path.exists(self.seen_path):
+            return
+        
+        try:
+            with open(self.seen_path, 'r', encoding='utf-8') as f:
+                self.seen = set(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"[SCRAPER] Erro ao carregar os links já extraídos: {e}")
+    
+    def _salvar_links_vistos(self):
+        """
+        Persiste os links das notícias já extraídas para as próximas execuções.
+        """
+        with open(self.seen_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(self.seen), f, ensure_ascii=False)
     
-    def extrair_pagina(self, url):
+    def _baixar_pagina(self, url):
         """
-        Extrai conteúdo de uma página.
+        Baixa uma página e retorna o corpo bruto da resposta.
         
         Parâmetros:
-        url (str): URL da página a ser extraída
+        url (str): URL da página
         
         Retorna:
-        BeautifulSoup: Objeto contendo o HTML parseado
+        bytes: Conteúdo da página, ou None em caso de erro
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            return response.content
         except requests.exceptions.RequestException as e:
             print(f"Erro ao acessar a página {url}: {e}")
             return None
     
-    def extrair_noticias_da_pagina(self, soup):
+    def _extrair_pagina_lxml(self, url):
         """
-        Extrai as notícias de uma página parseada.
+        Extrai conteúdo de uma página diretamente com o lxml, sem o BeautifulSoup.
+        
+        Parâmetros:
+        url (str): URL da página a ser extraída
+        
+        Retorna:
+        HtmlElement: Raiz do documento HTML parseado
+        """
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            
+            # Respeitar o charset declarado no Content-Type; sem ele, o lxml detecta
+            # a codificação pelo <meta charset> do próprio documento
+            parser = None
+            if 'charset' in response.headers.get('Content-Type', '').lower():
+                parser = lxml_html.HTMLParser(encoding=response.encoding)
+            return lxml_html.fromstring(response.content, parser=parser)
+        except (requests.exceptions.RequestException, LookupError,
+                etree.ParserError, etree.XMLSyntaxError) as e:
+            print(f"Erro ao acessar a página {url}: {e}")
+            return None
+    
+    def extrair_noticias_da_pagina(self, pagina):
+        """
+        Extrai as notícias de uma página de listagem.
+        
+        Parâmetros:
+        pagina (bytes): HTML bruto da página de listagem
+        
+        Retorna:
+        dict: Notícias da página, organizadas por coluna (sem a data de extração)
+        """
+        # Caminho rápido por busca de substrings; se a estrutura mudar, usar o BeautifulSoup
+        itens = _parse_list_fast(pagina)
+        if itens is None:
+            soup = BeautifulSoup(pagina, 'lxml', parse_only=_FEED_POST_STRAINER)
+            itens = self._extrair_itens_soup(soup)
+        
+        # Verificar se é uma checagem Fato ou Fake e classificá-la, com uma única
+        # conversão para minúsculas do título e do link
+        checagens = []
+        classificacoes = []
+        for item in itens:
+            # Ignorar notícias já extraídas (nesta ou em execuções anteriores)
+            if item['link'] in self.seen or item['link'] in self._links_na_execucao:
+                continue
+            
+            eh_checagem, classificacao = self._verificar_e_classificar(item['titulo'].lower(), item['link'].lower())
+            if eh_checagem:
+                checagens.append(item)
+                classificacoes.append(classificacao)
+                self._links_na_execucao.add(item['link'])
+        itens = checagens
+        
+        # Extrair o conteúdo detalhado das páginas das notícias em paralelo
+        # (a sessão HTTP é compartilhada entre as threads)
+        links = [item['link'] for item in itens]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+            lista_detalhes = list(ex.map(self._extrair_detalhes_noticia, links))
+        
+        # Marcar como já extraídas apenas as notícias cujos detalhes foram obtidos;
+        # as que falharam são tentadas de novo na próxima execução
+        for link, detalhes in zip(links, lista_detalhes):
+            if detalhes is not None:
+                self.seen.add(link)
+        lista_detalhes = [detalhes or {} for detalhes in lista_detalhes]
+        
+        # Montar uma lista por coluna, em vez de um dicionário por notícia
+        noticias = {
+            'titulo': [item['titulo'] for item in itens],
+            'link': links,
+            'data_publicacao': [item['data_publicacao'] for item in itens],
+            'resumo': [item['resumo'] for item in itens],
+            'classificacao': classificacoes,
+            'imagem_url': [item['imagem_url'] for item in itens],
+            'conteudo': [detalhes.get('conteudo', '') for detalhes in lista_detalhes],
+            'tags': [detalhes.get('tags', []) for detalhes in lista_detalhes],
+            'autor': [detalhes.get('autor', '') for detalhes in lista_detalhes]
+        }
+        
+        return noticias
+    
+    def _extrair_itens_soup(self, soup):
+        """
+        Extrai os itens de uma página de listagem já parseada pelo BeautifulSoup.
         
         Parâmetros:
         soup (BeautifulSoup): Objeto contendo o HTML parseado
         
         Retorna:
-        list: Lista de dicionários com as informações das notícias
+        list: Lista de dicionários com titulo, link, data_publicacao, resumo e imagem_url
         """
-        noticias = []
+        itens = []
         
         # Localizando os elementos da página que contêm as notícias
-        # Nota: Os seletores CSS podem precisar de ajustes conforme a estrutura atual do site
-        artigos = soup.select('.feed-post-body')
+        # Nota: As classes buscadas podem precisar de ajustes conforme a estrutura atual do site
+        # (busca direta por classe, sem o custo de interpretar seletores CSS a cada chamada)
+        artigos = soup.find_all(class_='feed-post-body')
         
         for artigo in artigos:
             try:
                 # Obtendo os elementos da notícia
-                titulo_element = artigo.select_one('.feed-post-link')
+                titulo_element = artigo.find(class_='feed-post-link')
                 if not titulo_element:
                     continue
                 
-                titulo = titulo_element.get_text().strip()
-                link = titulo_element['href']
-                
-                # Verificar se é uma checagem Fato ou Fake
-                if not self._eh_checagem_fato_ou_fake(titulo, link):
-                    continue
-                
                 # Extrair data da publicação
-                data_element = artigo.select_one('.feed-post-datetime')
-                data = data_element.get_text().strip() if data_element else "Data não encontrada"
+                data_element = artigo.find(class_='feed-post-datetime')
                 
                 # Extrair resumo/subtítulo
-                resumo_element = artigo.select_one('.feed-post-body-resumo')
-                resumo = resumo_element.get_text().strip() if resumo_element else ""
+                resumo_element = artigo.find(class_='feed-post-body-resumo')
                 
                 # Extrair imagem (se disponível)
-                img_element = artigo.select_one('.feed-post-figure img')
-                imagem_url = img_element['src'] if img_element and 'src' in img_element.attrs else ""
-                
-                # Determinar se é FATO ou FAKE com base no título ou resumo
-                classificacao = self._classificar_checagem(titulo, resumo)
-                
-                # Extrair conteúdo detalhado da página da notícia
-                detalhes = self._extrair_detalhes_noticia(link)
+                figura_element = artigo.find(class_='feed-post-figure')
+                img_element = figura_element.find('img') if figura_element else None
                 
-                noticia = {
-                    'titulo': titulo,
-                    'link': link,
-                    'data_publicacao': data,
-                    'resumo': resumo,
-                    'classificacao': classificacao,
-                    'imagem_url': imagem_url,
-                    'conteudo': detalhes.get('conteudo', ''),
-                    'tags': detalhes.get('tags', []),
-                    'autor': detalhes.get('autor', ''),
-                    'data_extracao': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                noticias.append(noticia)
+                itens.append({
+                    'titulo': titulo_element.get_text().strip(),
+                    'link': titulo_element['href'],
+                    'data_publicacao': data_element.get_text().strip() if data_element else "Data não encontrada",
+                    'resumo': resumo_element.get_text().strip() if resumo_element else "",
+                    'imagem_url': img_element['src'] if img_element and 'src' in img_element.attrs else ""
+                })
                 
             except Exception as e:
                 print(f"Erro ao processar artigo: {e}")
                 continue
         
-        return noticias
+        return itens
     
-    def _eh_checagem_fato_ou_fake(self, titulo, link):
+    def _verificar_e_classificar(self, titulo_lower, link_lower):
         """
-        Verifica se a notícia é uma checagem Fato ou Fake.
+        Verifica se a notícia é uma checagem Fato ou Fake e, se for,
+        determina se o conteúdo foi classificado como FATO ou FAKE.
         
         Parâmetros:
-        titulo (str): Título da notícia
-        link (str): Link da notícia
+        titulo_lower (str): Título da notícia, já em minúsculas
+        link_lower (str): Link da notícia, já em minúsculas
         
         Retorna:
-        bool: True se for uma checagem, False caso contrário
-        """
-        # Verificar pelo link se contém 'fato-ou-fake'
-        if 'fato-ou-fake' in link.lower():
-            return True
-        
-        # Verificar por palavras-chave no título
-        keywords = ['fato', 'fake', 'falso', 'verdade', 'é falso que', 'é verdade que', 'checamos']
-        for keyword in keywords:
-            if keyword.lower() in titulo.lower():
-                return True
-        
-        return False
-    
-    def _classificar_checagem(self, titulo, resumo):
+        tuple: (True se for uma checagem, 'FATO', 'FAKE', 'INDETERMINADO' ou None se não for)
         """
-        Determina se o conteúdo foi classificado como FATO ou FAKE.
+        # Verificar pelo link se contém 'fato-ou-fake' ou por palavras-chave no título
+        if 'fato-ou-fake' not in link_lower and not _CHECAGEM_RE.search(titulo_lower):
+            return False, None
         
-        Parâmetros:
-        titulo (str): Título da notícia
-        resumo (str): Resumo da notícia (não utilizado na classificação)
-        
-        Retorna:
-        str: 'FATO', 'FAKE' ou 'INDETERMINADO'
-        """
         # Considerar apenas o título para a classificação
-        texto_titulo = titulo.lower()
-        
-        # Padrões comuns usados pelo G1 para indicar FAKE no título
-        padroes_fake = [
-            'é fake',
-            'é falso', 
-            'não é verdade', 
-            'não é verdadeiro',
-            'falso que', 
-            'fake news',
-            'boato', 
-            'mentira', 
-            'enganoso', 
-            'não é real', 
-            'não aconteceu',
-            'não procede',
-            'não existe',
-            'não é fato'
-        ]
-        
-        # Padrões comuns usados pelo G1 para indicar FATO no título
-        padroes_fato = [
-            'é fato', 
-            'é verdade', 
-            'verdadeiro', 
-            'aconteceu', 
-            'é real',
-            'confirmado', 
-            'verificado', 
-            'comprovado',
-            'procede',
-            'é verdadeiro'
-        ]
-        
-        # Verificar se é FAKE
-        for padrao in padroes_fake:
-            if padrao in texto_titulo:
-                return 'FAKE'
-        
-        # Verificar se é FATO
-        for padrao in padroes_fato:
-            if padrao in texto_titulo:
-                return 'FATO'
-        
-        # Verificar se é FAKE com base em apenas "fake" isolado
-        if re.search(r'\bfake\b', texto_titulo, re.IGNORECASE):
-            return 'FAKE'
-            
-        # Verificar se é FATO com base em apenas "fato" isolado
-        if re.search(r'\bfato\b', texto_titulo, re.IGNORECASE):
-            return 'FATO'
+        for padrao, rotulo in _CLASSIFICADORES:
+            if padrao.search(titulo_lower):
+                return True, rotulo
         
         # Se não foi possível determinar com certeza
-        return 'INDETERMINADO'
+        return True, 'INDETERMINADO'
     
     def _extrair_detalhes_noticia(self, url):
         """
@@ -212,7 +497,7 @@ class FatoOuFakeScraper:
         url (str): URL da notícia
         
         Retorna:
-        dict: Dicionário com os detalhes da notícia
+        dict: Dicionário com os detalhes da notícia, ou None se a página não pôde ser extraída
         """
         detalhes = {
             'conteudo': '',
@@ -220,27 +505,28 @@ class FatoOuFakeScraper:
             'autor': ''
         }
         
-        soup = self.extrair_pagina(url)
-        if not soup:
-            return detalhes
+        doc = self._extrair_pagina_lxml(url)
+        if doc is None:
+            return None
         
         try:
             # Extrair conteúdo principal
-            conteudo_elements = soup.select('.content-text__container p')
-            conteudo = ' '.join([p.get_text().strip() for p in conteudo_elements])
+            conteudo_elements = _XPATH_CONTEUDO(doc)
+            conteudo = ' '.join([p.text_content().strip() for p in conteudo_elements])
             detalhes['conteudo'] = conteudo
             
             # Extrair tags (se disponíveis)
-            tags_elements = soup.select('.entities__list-item')
-            detalhes['tags'] = [tag.get_text().strip() for tag in tags_elements]
+            tags_elements = _XPATH_TAGS(doc)
+            detalhes['tags'] = [tag.text_content().strip() for tag in tags_elements]
             
             # Extrair autor
-            autor_element = soup.select_one('.content-publication-data__from')
-            if autor_element:
-                detalhes['autor'] = autor_element.get_text().strip()
+            autor_elements = _XPATH_AUTOR(doc)
+            if autor_elements:
+                detalhes['autor'] = autor_elements[0].text_content().strip()
             
         except Exception as e:
             print(f"Erro ao extrair detalhes da notícia {url}: {e}")
+            return None
         
         return detalhes
     
@@ -249,34 +535,51 @@ class FatoOuFakeScraper:
         Percorre múltiplas páginas para extrair notícias.
         
         Retorna:
-        list: Lista de todas as notícias extraídas
+        dict: Todas as notícias extraídas, organizadas por coluna
         """
-        todas_noticias = []
+        todas_noticias = {coluna: [] for coluna in _COLUNAS}
+        
+        # Data e hora da extração, comum a todas as notícias desta execução
+        data_extracao = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         print(f"[SCRAPER] Iniciando extração em {self.num_pages} páginas...")
         
         # Primeira página (principal)
-        soup_primeira_pagina = self.extrair_pagina(self.base_url)
-        if soup_primeira_pagina:
-            noticias_pagina = self.extrair_noticias_da_pagina(soup_primeira_pagina)
-            todas_noticias.extend(noticias_pagina)
-            print(f"[SCRAPER] Página 1: {len(noticias_pagina)} notícias extraídas")
-        
-        # Percorrer páginas adicionais (se houver paginação)
-        for i in range(2, self.num_pages + 1):
-            # O formato de URL para páginas adicionais pode variar
-            # Aqui estamos supondo um formato comum, mas pode ser necessário ajustar
-            next_page_url = f"{self.base_url}?page={i}"
-            
-            soup_pagina = self.extrair_pagina(next_page_url)
-            if soup_pagina:
-                noticias_pagina = self.extrair_noticias_da_pagina(soup_pagina)
-                todas_noticias.extend(noticias_pagina)
-                print(f"[SCRAPER] Página {i}: {len(noticias_pagina)} notícias extraídas")
-            else:
-                print(f"[SCRAPER] Falha ao acessar página {i}")
-                break
+        primeira_pagina = self._baixar_pagina(self.base_url)
+        if primeira_pagina:
+            noticias_pagina = self.extrair_noticias_da_pagina(primeira_pagina)
+            for coluna, valores in noticias_pagina.items():
+                todas_noticias[coluna].extend(valores)
+            print(f"[SCRAPER] Página 1: {len(noticias_pagina['link'])} notícias extraídas")
+        
+        # Percorrer páginas adicionais (se houver paginação), baixando-as em lotes paralelos
+        # e processando-as em ordem; a primeira falha encerra a paginação
+        numeros = list(range(2, self.num_pages + 1))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_PAGINAS_POR_LOTE) as ex:
+            for inicio in range(0, len(numeros), _PAGINAS_POR_LOTE):
+                lote = numeros[inicio:inicio + _PAGINAS_POR_LOTE]
+                
+                # O formato de URL para páginas adicionais pode variar
+                # Aqui estamos supondo um formato comum, mas pode ser necessário ajustar
+                urls = [f"{self.base_url}?page={i}" for i in lote]
+                paginas = list(ex.map(self._baixar_pagina, urls))
+                
+                falhou = False
+                for i, pagina in zip(lote, paginas):
+                    if pagina:
+                        noticias_pagina = self.extrair_noticias_da_pagina(pagina)
+                        for coluna, valores in noticias_pagina.items():
+                            todas_noticias[coluna].extend(valores)
+                        print(f"[SCRAPER] Página {i}: {len(noticias_pagina['link'])} notícias extraídas")
+                    else:
+                        print(f"[SCRAPER] Falha ao acessar página {i}")
+                        falhou = True
+                        break
+                
+                if falhou:
+                    break
         
+        todas_noticias['data_extracao'] = [data_extracao] * len(todas_noticias['link'])
         return todas_noticias
     
     def executar_extracao(self):
@@ -289,11 +592,17 @@ class FatoOuFakeScraper:
         print(f"[SCRAPER] Extração iniciada")
         
         # Extrair notícias de todas as páginas
-        self.dataset = self.percorrer_paginas()
-        print(f"[SCRAPER] Concluído. Total: {len(self.dataset)} notícias extraídas")
-        
-        # Converter para DataFrame
+        try:
+            self.dataset = self.percorrer_paginas()
+        finally:
+            self.close()
+        self._salvar_links_vistos()
+        print(f"[SCRAPER] Concluído. Total: {len(self.dataset['link'])} notícias extraídas")
+        
+        # Converter para DataFrame diretamente a partir das colunas; a classificação
+        # tem só três valores possíveis e é guardada como categoria
         df = pd.DataFrame(self.dataset)
+        df['classificacao'] = df['classificacao'].astype('category')
         
         return df
     
@@ -303,26 +612,37 @@ class FatoOuFakeScraper:
         
         Parâmetros:
         df (DataFrame): DataFrame com os dados
-        formato (str): Formato de saída ('csv' ou 'json')
+        formato (str): Formato de saída ('csv', 'json' ou 'parquet')
         
         Retorna:
         str: Caminho do arquivo salvo
         """
-        # Criar pasta 'datasets' se não existir
-        if not os.path.exists('datasets'):
-            os.makedirs('datasets')
-        
         # Gerar nome do arquivo com timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if formato.lower() == 'csv':
             filepath = f'datasets/fato_ou_fake_{timestamp}.csv'
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            # Listas (ex.: tags) e categorias não são suportadas pelo escritor CSV do PyArrow
+            df_csv = df.astype({'tags': str, 'classificacao': str}) if not df.empty else df
+            pacsv.write_csv(pa.Table.from_pandas(df_csv, preserve_index=False), filepath)
         elif formato.lower() == 'json':
             filepath = f'datasets/fato_ou_fake_{timestamp}.json'
-            df.to_json(filepath, orient='records', force_ascii=False, indent=4)
+            # Serializar registro a registro direto no arquivo, percorrendo as linhas
+            # sem montar listas das colunas, dos registros ou o JSON inteiro em memória
+            colunas = list(df.columns)
+            opcoes = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            with open(filepath, 'wb') as f:
+                f.write(b'[')
+                for i, linha in enumerate(df.itertuples(index=False, name=None)):
+                    f.write(b',\n' if i else b'\n')
+                    f.write(orjson.dumps(dict(zip(colunas, linha)), option=opcoes))
+                f.write(b'\n]')
+        elif formato.lower() == 'parquet':
+            filepath = f'datasets/fato_ou_fake_{timestamp}.parquet'
+            # Formato colunar e comprimido, que preserva as listas de tags e a categoria
+            df.to_parquet(filepath, index=False)
         else:
-            raise ValueError(f"Formato '{formato}' não suportado. Use 'csv' ou 'json'.")
+            raise ValueError(f"Formato '{formato}' não suportado. Use 'csv', 'json' ou 'parquet'.")
         
         print(f"[SCRAPER] Dataset salvo em: {filepath}")
         return filepath
@@ -336,18 +656,23 @@ if __name__ == "__main__":
     # Executar extração
     df_noticias = scraper.executar_extracao()
     
-    # Exibir estatísticas básicas
-    total_noticias = len(df_noticias)
-    total_fake = len(df_noticias[df_noticias['classificacao'] == 'FAKE'])
-    total_fato = len(df_noticias[df_noticias['classificacao'] == 'FATO'])
-    total_indeterminado = len(df_noticias[df_noticias['classificacao'] == 'INDETERMINADO'])
-    
-    print(f"\nEstatísticas do Dataset:")
-    print(f"Total de notícias: {total_noticias}")
-    print(f"Classificadas como FAKE: {total_fake} ({total_fake/total_noticias*100:.1f}%)")
-    print(f"Classificadas como FATO: {total_fato} ({total_fato/total_noticias*100:.1f}%)")
-    print(f"Classificação indeterminada: {total_indeterminado} ({total_indeterminado/total_noticias*100:.1f}%)")
-    
-    # Salvar em CSV e JSON
-    scraper.salvar_dataset(df_noticias, formato='csv')
-    scraper.salvar_dataset(df_noticias, formato='json')
\ No newline at end of file
+    if not df_noticias.empty:
+        # Exibir estatísticas básicas
+        total_noticias = len(df_noticias)
+        # Contar todas as classificações em uma única passagem
+        contagens = df_noticias['classificacao'].value_counts()
+        total_fake = contagens.get('FAKE', 0)
+        total_fato = contagens.get('FATO', 0)
+        total_indeterminado = contagens.get('INDETERMINADO', 0)
+        
+        print(f"\nEstatísticas do Dataset:")
+        print(f"Total de notícias: {total_noticias}")
+        print(f"Classificadas como FAKE: {total_fake} ({total_fake/total_noticias*100:.1f}%)")
+        print(f"Classificadas como FATO: {total_fato} ({total_fato/total_noticias*100:.1f}%)")
+        print(f"Classificação indeterminada: {total_indeterminado} ({total_indeterminado/total_noticias*100:.1f}%)")
+        
+        # Salvar em CSV e JSON
+        scraper.salvar_dataset(df_noticias, formato='csv')
+        scraper.salvar_dataset(df_noticias, formato='json')
+    else:
+        print("Nenhuma notícia nova extraída para salvar.")